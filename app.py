@@ -2,13 +2,28 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+
+import orjson
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 
+from config import settings
 from webhook import webhook_bp
 
+logging.basicConfig(level=settings.log_level)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Parse incoming webhook bodies with orjson; responses keep Flask's encoder."""
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.register_blueprint(webhook_bp)
 
     @app.route("/")
@@ -22,5 +37,4 @@ app = create_app()
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
     app.run(port=5000, debug=True)
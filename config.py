@@ -17,6 +17,13 @@ class Settings:
     app_secret: Optional[str] = os.getenv("APP_SECRET")
     business_account_id: Optional[str] = os.getenv("WHATSAPP_BUSINESS_ACCOUNT_ID")
     test_number: Optional[str] = os.getenv("TEST_NUMBER")
+    reply_workers: int = int(os.getenv("REPLY_WORKERS", "32"))
+    redis_url: Optional[str] = os.getenv("REDIS_URL")
+    session_ttl: int = int(os.getenv("SESSION_TTL", "1800"))
+    log_level: str = os.getenv("LOG_LEVEL", "WARNING").upper()
+    backend_connect_timeout: float = float(os.getenv("BACKEND_CONNECT_TIMEOUT", "3.05"))
+    backend_read_timeout: float = float(os.getenv("BACKEND_READ_TIMEOUT", "10"))
+    levels_cache_ttl: int = int(os.getenv("LEVELS_CACHE_TTL", "3600"))
 
     def credentials_ready(self) -> bool:
         return bool(self.access_token and self.phone_number_id)
@@ -1,32 +1,65 @@
 """Main conversation engine for JalNiti bot."""
 from __future__ import annotations
 
+import logging
 import os
+import threading
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Callable, ClassVar, Dict, List, Optional, Tuple, TypeVar
 
 from models import ConversationState
 from services import SolvencyService, SowingService
+from session_store import SessionStore, make_session_store
 from translations import get_message, ENGLISH, HINDI, MARATHI
 
+logger = logging.getLogger(__name__)
+
+# Messages that soft-reset the conversation back to the menu / setup
+_GREETINGS = frozenset({"hi", "hello", "hey", "start", "menu"})
+
+# Menu replies -> language code / area code
+_LANG_CHOICE = {"1": ENGLISH, "2": HINDI, "3": MARATHI}
+_AREA_CHOICE = {"u": "U", "urban": "U", "r": "R", "rural": "R"}
+
+T = TypeVar("T")
+
+
+def _pick_numbered(options: Optional[List[T]], message: str) -> Optional[T]:
+    """Return the option for a 1-based menu reply, or None if it is not a valid choice."""
+    try:
+        idx = int(message) - 1
+    except ValueError:
+        return None
+    if options and 0 <= idx < len(options):
+        return options[idx]
+    return None
+
 
 @dataclass
 class ConversationEngine:
     """Main conversation engine that manages user sessions and message routing."""
     
-    sessions: Dict[str, ConversationState] = field(default_factory=dict)
+    session_store: SessionStore = field(default_factory=make_session_store)
     backend_url: str = field(default_factory=lambda: os.getenv("BACKEND_BASE_URL"))
     
     def __post_init__(self):
-        """Initialize services after dataclass initialization."""
-        self.solvency_service = SolvencyService(self.backend_url)
-        self.sowing_service = SowingService(self.backend_url)
+        """Attach the (shared) backend services after dataclass initialization."""
+        self.solvency_service, self.sowing_service = _services_for(self.backend_url)
 
     def handle_incoming(self, user_id: str, message: str) -> str:
-        normalized = (message or "").strip().lower()
-        session = self.sessions.setdefault(user_id, ConversationState())
+        session = self.session_store.get(user_id) or ConversationState()
+        try:
+            return self._route(message, session)
+        finally:
+            self.session_store.put(user_id, session)
+
+    def _route(self, message: str, session: ConversationState) -> str:
+        stripped = (message or "").strip()
+        normalized = stripped.lower()
+        state = session.state
         lang = session.language
         has_language = session.language_set  # Track if language was explicitly chosen
+        loc_done = session.location_setup_complete  # not changed by a soft reset
 
         # Full reset (clears everything including location and language)
         if normalized == "reset":
@@ -35,9 +68,12 @@ class ConversationEngine:
             return get_message("welcome_language", ENGLISH)
 
         # Soft reset — go to menu if location is set, else continue setup
-        if normalized in {"hi", "hello", "hey", "start", "menu"}:
+        if normalized in _GREETINGS:
+            # Already sitting at the menu: nothing to flush, just show it again
+            if state == "MAIN_MENU" and loc_done:
+                return get_message("main_menu", lang)
             session.reset()
-            if session.location_setup_complete:
+            if loc_done:
                 return get_message("main_menu", lang)
             elif has_language:
                 # Language set but location not complete — continue location setup
@@ -48,61 +84,36 @@ class ConversationEngine:
                 return get_message("welcome_language", ENGLISH)
 
         # Route to appropriate handler based on state
-        if session.state == "START":
-            if has_language and session.location_setup_complete:
-                session.state = "MAIN_MENU"
-                return get_message("main_menu", lang)
-            elif has_language:
-                session.state = "SETUP_AREA_TYPE"
-                return get_message("ask_area_type", lang)
-            else:
-                session.state = "SELECT_LANGUAGE"
-                return get_message("welcome_language", ENGLISH)
-
-        if session.state == "SELECT_LANGUAGE":
-            return self._handle_language_selection(normalized, session)
-
-        # ── Location setup flow ──────────────────────────────────────────
-        if session.state == "SETUP_AREA_TYPE":
-            return self._handle_area_type(normalized, session)
-        if session.state == "SETUP_SELECT_DISTRICT":
-            return self._handle_district_selection(message, session)
-        if session.state == "SETUP_SELECT_TALUKA":
-            return self._handle_taluka_selection(message, session)
-        if session.state == "SETUP_SELECT_VILLAGE":
-            return self._handle_village_selection(message, session)
-        if session.state == "SETUP_SELECT_PLOT":
-            return self._handle_plot_selection(message, session)
-        if session.state == "SETUP_SELECT_OWNER":
-            return self._handle_owner_selection(message, session)
-
-        # ── Main menu (after location setup) ─────────────────────────────
-        if session.state == "MAIN_MENU":
-            return self._handle_main_menu(normalized, session)
-
-        # ── Service flows ────────────────────────────────────────────────
-        if session.state == "SOWING_COLLECT_CROP":
-            return self._handle_sowing_crop(message, session)
-        if session.state == "SOLVENCY_COLLECT_CROP":
-            return self._handle_solvency_crop(message, session)
-
-        # Default fallback
-        return get_message("fallback", lang)
+        entry = self._DISPATCH.get(state)
+        if entry is None:
+            return get_message("fallback", lang)
+        handler, wants_normalized = entry
+        return handler(self, normalized if wants_normalized else stripped, session)
+    
+    # ── Start ────────────────────────────────────────────────────────────
+    
+    def _handle_start(self, message: str, session: ConversationState) -> str:
+        lang = session.language
+        has_language = session.language_set
+        if has_language and session.location_setup_complete:
+            session.state = "MAIN_MENU"
+            return get_message("main_menu", lang)
+        elif has_language:
+            session.state = "SETUP_AREA_TYPE"
+            return get_message("ask_area_type", lang)
+        else:
+            session.state = "SELECT_LANGUAGE"
+            return get_message("welcome_language", ENGLISH)
     
     # ── Language Selection ───────────────────────────────────────────────
     
     def _handle_language_selection(self, choice: str, session: ConversationState) -> str:
-        if choice == "1":
-            session.language = ENGLISH
-        elif choice == "2":
-            session.language = HINDI
-        elif choice == "3":
-            session.language = MARATHI
-        else:
+        lang = _LANG_CHOICE.get(choice)
+        if lang is None:
             return get_message("invalid_language", ENGLISH)
         
+        session.language = lang
         session.language_set = True  # Mark language as explicitly chosen
-        lang = session.language
         # After language, start location setup
         session.state = "SETUP_AREA_TYPE"
         result = get_message("language_set", lang) + "\n\n"
@@ -112,54 +123,44 @@ class ConversationEngine:
     # ── Location Setup Flow ──────────────────────────────────────────────
     
     def _handle_area_type(self, choice: str, session: ConversationState) -> str:
-        lang = session.language
-        if choice in ['u', 'urban']:
-            session.area = "U"
-        elif choice in ['r', 'rural']:
-            session.area = "R"
-        else:
-            return get_message("invalid_area_type", lang)
+        area = _AREA_CHOICE.get(choice)
+        if area is None:
+            return get_message("invalid_area_type", session.language)
+        session.area = area
         return self.solvency_service.get_districts(session)
     
     def _handle_district_selection(self, message: str, session: ConversationState) -> str:
         lang = session.language
-        selection = message.strip()
-        if session.district_map and selection in session.district_map:
-            session.district_code = session.district_map[selection]
+        selected = _pick_numbered(session.district_list, message)
+        if selected is not None:
+            session.district_code = selected
             return self.solvency_service.get_talukas(session)
         return get_message("invalid_selection", lang)
     
     def _handle_taluka_selection(self, message: str, session: ConversationState) -> str:
         lang = session.language
-        selection = message.strip()
-        if session.taluka_map and selection in session.taluka_map:
-            session.taluka_code = session.taluka_map[selection]
+        selected = _pick_numbered(session.taluka_list, message)
+        if selected is not None:
+            session.taluka_code = selected
             return self.solvency_service.get_villages(session)
         return get_message("invalid_selection", lang)
     
     def _handle_village_selection(self, message: str, session: ConversationState) -> str:
         lang = session.language
-        selection = message.strip()
-        if session.village_map and selection in session.village_map:
-            session.village_gis_code = session.village_map[selection]
+        selected = _pick_numbered(session.village_list, message)
+        if selected is not None:
+            session.village_gis_code = selected
             return self.solvency_service.get_surveys(session)
         return get_message("invalid_selection", lang)
     
     def _handle_plot_selection(self, message: str, session: ConversationState) -> str:
         """Handle plot selection, fetch info with owners list."""
         lang = session.language
-        plot_no = message.strip()
+        plot_no = message
         
         # Validate against available plots
-        if session.available_plots:
-            available = []
-            for plot in session.available_plots:
-                if isinstance(plot, dict) and 'plotNo' in plot:
-                    available.append(str(plot['plotNo']))
-                else:
-                    available.append(str(plot))
-            if plot_no not in available:
-                return get_message("plot_not_found", lang, plot_no=plot_no)
+        if session.available_plots_set and plot_no not in session.available_plots_set:
+            return get_message("plot_not_found", lang, plot_no=plot_no)
         
         session.plot_no = plot_no
         
@@ -173,16 +174,14 @@ class ConversationEngine:
     def _handle_owner_selection(self, message: str, session: ConversationState) -> str:
         """Handle owner selection, save area, calculate balance, complete setup."""
         lang = session.language
-        selection = message.strip()
-        
-        if not session.owner_map or selection not in session.owner_map:
+        owner_data = _pick_numbered(session.owner_list, message)
+        if owner_data is None:
             return get_message("invalid_owner_selection", lang)
         
         # Save selected owner's name and area
-        owner_data = session.owner_map[selection]
         session.owner_name = owner_data['name']
         session.farm_area_ares = owner_data['area']
-        print(f"[DEBUG] Owner selected: {session.owner_name}, area saved: {session.farm_area_ares}")
+        logger.debug("Owner selected: %s, area saved: %s", session.owner_name, session.farm_area_ares)
         
         try:
             # Calculate water balance SILENTLY (no display)
@@ -230,7 +229,7 @@ class ConversationEngine:
     # ── Sowing Advisory ──────────────────────────────────────────────────
     
     def _handle_sowing_crop(self, message: str, session: ConversationState) -> str:
-        session.crop = message.strip()
+        session.crop = message
         result = self.sowing_service.get_sowing_advice(session)
         session.state = "MAIN_MENU"
         return result
@@ -238,12 +237,55 @@ class ConversationEngine:
     # ── Solvency Check ───────────────────────────────────────────────────
     
     def _handle_solvency_crop(self, message: str, session: ConversationState) -> str:
-        session.crop = message.strip()
+        session.crop = message
         result = self.solvency_service.get_water_requirement(session)
         session.state = "MAIN_MENU"
         return result
+    
+    # ── Dispatch table ───────────────────────────────────────────────────
+    # state -> (handler, whether it receives the lower-cased message).
+    # Handlers always get the message already stripped of surrounding whitespace.
+    
+    _DISPATCH: ClassVar[Dict[str, Tuple[Callable[..., str], bool]]] = {
+        "START": (_handle_start, True),
+        "SELECT_LANGUAGE": (_handle_language_selection, True),
+        # Location setup flow
+        "SETUP_AREA_TYPE": (_handle_area_type, True),
+        "SETUP_SELECT_DISTRICT": (_handle_district_selection, False),
+        "SETUP_SELECT_TALUKA": (_handle_taluka_selection, False),
+        "SETUP_SELECT_VILLAGE": (_handle_village_selection, False),
+        "SETUP_SELECT_PLOT": (_handle_plot_selection, False),
+        "SETUP_SELECT_OWNER": (_handle_owner_selection, False),
+        # Main menu (after location setup)
+        "MAIN_MENU": (_handle_main_menu, True),
+        # Service flows
+        "SOWING_COLLECT_CROP": (_handle_sowing_crop, False),
+        "SOLVENCY_COLLECT_CROP": (_handle_solvency_crop, False),
+    }
+
+
+# Built lazily on the reply lanes; the locks make sure concurrent first messages
+# share one instance (lru_cache would let each of them build its own)
+_services: Dict[str, Tuple[SolvencyService, SowingService]] = {}
+_services_lock = threading.Lock()
+_default_engine: Optional[ConversationEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def _services_for(backend_url: str) -> Tuple[SolvencyService, SowingService]:
+    """Return the service pair for a backend, built once and shared by all engines."""
+    with _services_lock:
+        services = _services.get(backend_url)
+        if services is None:
+            services = _services[backend_url] = (SolvencyService(backend_url), SowingService(backend_url))
+    return services
 
 
 def default_engine() -> ConversationEngine:
-    """Create and return the default conversation engine instance."""
-    return ConversationEngine()
+    """Return the process-wide default conversation engine instance."""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = ConversationEngine()
+    return _default_engine
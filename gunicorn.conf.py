@@ -0,0 +1,20 @@
+"""Gunicorn settings for serving the webhook: ``gunicorn app:app``."""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# One process by default: each user's messages are kept in order by the in-process
+# reply lanes, and sessions are read and written back without a lock. With several
+# workers (only sensible with REDIS_URL) two quick messages from the same user can
+# be handled concurrently by different processes and one session update lost.
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+
+# The webhook only queues replies, so threads are enough to overlap requests.
+# GUNICORN_WORKER_CLASS=gevent switches to greenlets (requires gevent); the worker
+# monkey-patches sockets itself, which makes the blocking HTTP clients cooperative.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", "32"))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+keepalive = 30
+timeout = 30
@@ -1,13 +1,19 @@
 """Conversation state model for tracking user sessions."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, fields
+from typing import FrozenSet, List, Optional
 
+# Per-flow scratch data cleared by ConversationState.reset()
+_FLOW_FIELDS = ("crop", "available_plots_set", "district_list", "taluka_list", "village_list", "owner_list")
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationState:
-    """Tracks the state of a user's conversation session."""
+    """Tracks the state of a user's conversation session.
+    
+    Slotted so each live session carries no per-instance ``__dict__``.
+    """
     
     state: str = "START"
     
@@ -27,7 +33,7 @@ class ConversationState:
     plot_no: Optional[str] = None
     plot_owners: Optional[list] = None  # Store all plot owner info
     owner_name: Optional[str] = None  # Selected owner name
-    owner_map: Optional[Dict[str, dict]] = None  # Map index to owner data
+    owner_list: Optional[List[dict]] = None  # Owner data in menu order (choice N -> index N-1)
     location_setup_complete: bool = False  # True once location is fully set up
     
     # Water balance (calculated once after location setup)
@@ -36,10 +42,16 @@ class ConversationState:
     
     # Temporary flow data (reset on menu)
     crop: Optional[str] = None
-    available_plots: Optional[list] = None
-    district_map: Optional[Dict[str, str]] = None
-    taluka_map: Optional[Dict[str, str]] = None
-    village_map: Optional[Dict[str, str]] = None
+    available_plots_set: Optional[FrozenSet[str]] = None  # Plot numbers in the selected village
+    # Codes in menu order (choice N -> index N-1)
+    district_list: Optional[List[str]] = None
+    taluka_list: Optional[List[str]] = None
+    village_list: Optional[List[str]] = None
+    
+    def __post_init__(self) -> None:
+        # Sessions restored from JSON carry the plot numbers as a plain list
+        if self.available_plots_set is not None and not isinstance(self.available_plots_set, frozenset):
+            self.available_plots_set = frozenset(self.available_plots_set)
     
     def has_location(self) -> bool:
         """Check if full location data is available."""
@@ -52,35 +64,11 @@ class ConversationState:
     def reset(self) -> None:
         """Reset flow data but preserve location and language."""
         self.state = "MAIN_MENU" if self.location_setup_complete else "START"
-        self.crop = None
-        self.available_plots = None
-        self.district_map = None
-        self.taluka_map = None
-        self.village_map = None
-        self.owner_map = None
+        for name in _FLOW_FIELDS:
+            setattr(self, name, None)
     
     def full_reset(self) -> None:
         """Fully reset all session data including saved location and language."""
-        self.state = "START"
-        self.language = "en"
-        self.language_set = False
-        self.latitude = None
-        self.longitude = None
-        self.farm_area_ares = None
-        self.area = None
-        self.district_code = None
-        self.taluka_code = None
-        self.village_code = None
-        self.village_gis_code = None
-        self.plot_no = None
-        self.plot_owners = None
-        self.owner_name = None
-        self.owner_map = None
-        self.location_setup_complete = False
-        self.water_balance_value = None
-        self.water_balance_data = None
-        self.crop = None
-        self.available_plots = None
-        self.district_map = None
-        self.taluka_map = None
-        self.village_map = None
+        fresh = ConversationState()
+        for f in fields(self):
+            setattr(self, f.name, getattr(fresh, f.name))
@@ -0,0 +1,109 @@
+"""Shared HTTP session for calls to the JalNiti backend."""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+import orjson
+import pybreaker
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+from config import settings
+
+# (connect, read) timeout for backend calls: fail fast on an unreachable host
+# without cutting off slow-but-working endpoints
+BACKEND_TIMEOUT = (settings.backend_connect_timeout, settings.backend_read_timeout)
+
+# Upper bound on a Retry-After wait, so a rate-limited backend can't park a reply
+# thread for minutes where the circuit breaker never sees it
+MAX_RETRY_WAIT = 5
+
+
+class _BackendRetry(Retry):
+    """Retry policy that never repeats a request whose response timed out.
+    
+    Other read errors (e.g. a pooled keep-alive connection the backend already
+    closed) are still retried on idempotent methods, on a fresh socket.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if isinstance(error, ReadTimeoutError):
+            raise MaxRetryError(_pool, url, error) from error
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def make_http_session(pool_connections: int = 16, pool_maxsize: int = 64) -> requests.Session:
+    """Create a keep-alive session whose connection pool fits concurrent reply lanes.
+    
+    Idempotent requests are retried with backoff on gateway errors and rate limiting,
+    honouring Retry-After for at most ``MAX_RETRY_WAIT`` seconds. Once retries run out the last response is returned and
+    ``call_backend`` turns its status into an ``HTTPError``. A failed connect or
+    dropped connection is retried once and a read timeout not at all, so a hung
+    backend costs a single timeout period.
+    """
+    session = requests.Session()
+    retries = _BackendRetry(total=3, connect=1, read=1, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                    respect_retry_after_header=True, retry_after_max=MAX_RETRY_WAIT, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+# One pool per process, shared by every service so backend connections are reused
+http_session = make_http_session()
+
+
+class BackendUnavailable(requests.exceptions.ConnectionError):
+    """Raised without touching the network while an endpoint group's circuit is open."""
+
+
+def _is_client_error(error: BaseException) -> bool:
+    """4xx responses are answers about the request, not signs of a failing backend."""
+    return isinstance(error, requests.exceptions.HTTPError) and error.response is not None \
+        and error.response.status_code < 500
+
+
+# One breaker per backend endpoint group: after 5 consecutive failures the group is
+# short-circuited for 30s, so a hung endpoint can't tie up every reply lane on timeouts.
+# Speculative requests use the matching "-prefetch" group so they can't trip the
+# group real users depend on.
+_breakers: Dict[str, pybreaker.CircuitBreaker] = {
+    group: pybreaker.CircuitBreaker(fail_max=5, reset_timeout=30, exclude=[_is_client_error], name=group)
+    for group in ("levels", "levels-prefetch", "crop", "crop-prefetch", "balance", "balance-prefetch", "sowing")
+}
+
+
+def call_backend(group: str, send: Callable[..., requests.Response], url: str, **kwargs: Any) -> requests.Response:
+    """Issue ``send(url, **kwargs)`` through the circuit breaker of an endpoint group.
+    
+    Any 4xx/5xx response is raised as ``HTTPError``, so callers only see successful
+    responses. Connection errors, timeouts and 5xx responses count as failures. While
+    the circuit is open, ``BackendUnavailable`` is raised, which callers already treat
+    like any other connection error.
+    
+    ``calling()`` only holds the breaker's lock while checking and updating its
+    state, so requests in the same group still run concurrently.
+    """
+    try:
+        with _breakers[group].calling():
+            response = send(url, **kwargs)
+            response.raise_for_status()
+    except pybreaker.CircuitBreakerError as e:
+        raise BackendUnavailable(f"{group} backend temporarily unavailable") from e
+    return response
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Decode a response body with orjson, falling back to the stdlib parser.
+    
+    The fallback covers NaN/Infinity literals, which Python/pandas backends can
+    emit and orjson rejects.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return response.json()
@@ -1,33 +1,154 @@
 """Service for crop solvency check operations."""
 from __future__ import annotations
 
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import requests
-from typing import TYPE_CHECKING, Optional
+from cachetools import TTLCache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
-from translations import get_message
+from config import settings
+from translations import get_message, get_template
+from .http_client import BACKEND_TIMEOUT, BackendUnavailable, call_backend, http_session, parse_json
 
 if TYPE_CHECKING:
     from models.conversation_state import ConversationState
 
+logger = logging.getLogger(__name__)
+
+# Administrative boundaries and survey lists change rarely, so /levels/* responses
+# are kept per process (an hour by default), keyed by (backend, endpoint, params).
+_levels_cache: TTLCache = TTLCache(maxsize=4096, ttl=settings.levels_cache_ttl)
+_levels_cache_lock = threading.Lock()
+
+# Lookups that came back empty; remembered briefly so prefetching doesn't keep
+# asking for them (user lookups still retry, in case the empty answer was transient)
+_levels_empty: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+# Top-crop recommendations only change per weather station and season, so they are
+# shared per ~100m grid cell (coordinates rounded to 3 decimals) for an hour
+_top_crops_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+_top_crops_cache_lock = threading.Lock()
+
+# gw-balance requests started while the user is still choosing a plot owner, keyed
+# by (backend, lat, lon, farm_area_ares) and consumed by calculate_water_balance.
+# Plots with more distinct owner areas than the limit are not prefetched.
+_balance_prefetch: TTLCache = TTLCache(maxsize=1024, ttl=300)
+_balance_prefetch_lock = threading.Lock()
+_MAX_BALANCE_PREFETCH = 3
+
+# Field names the gw-balance API has used for the available groundwater, in priority order
+_BALANCE_FIELDS = (
+    'groundwater_available_litres', 'balance', 'gw_balance', 'available_water', 'groundwater_balance',
+    'total_balance', 'water_balance', 'net_balance',
+    'water_required_litres', 'available_litres', 'total_water',
+)
+
+# Background threads for speculative backend requests
+_prefetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="prefetch")
+
+# Location lists prefetched ahead of the user's next choice get their own small pool,
+# so they never queue in front of the requests above; the semaphore caps how many are
+# queued or running at once, so a long district list is warmed over several visits
+_levels_prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="levels-prefetch")
+_levels_prefetch_slots = threading.BoundedSemaphore(8)
+
+
+def _levels_key(backend_url: str, endpoint: str, params: dict) -> Tuple:
+    """Cache key for a /levels/<endpoint> lookup against a given backend."""
+    return (backend_url, endpoint, tuple(sorted(params.items())))
+
 
 class SolvencyService:
     """Handles all crop solvency check and recommendation API operations."""
     
-    def __init__(self, backend_url: str):
+    def __init__(self, backend_url: str, http: Optional[requests.Session] = None):
         self.backend_url = backend_url
+        self.http = http or http_session
+        # In-flight location lookups, shared by concurrent users asking for the same list
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     # ── helpers ───────────────────────────────────────────────────────────
 
+    def _fetch_level(self, endpoint: str, params: dict, breaker: str = "levels") -> Any:
+        """GET a location-hierarchy list from /levels/<endpoint>.
+        
+        Non-empty responses are served from the process-wide TTL cache. On a miss,
+        concurrent identical lookups are coalesced: the first caller performs the
+        request and everyone else waiting on the same (endpoint, params) receives
+        its result (or its exception). ``breaker`` names the circuit breaker group
+        the request counts against.
+        """
+        key = _levels_key(self.backend_url, endpoint, params)
+        with _levels_cache_lock:
+            cached = _levels_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            response = call_backend(breaker, self.http.get, f"{self.backend_url}/levels/{endpoint}", params=params, timeout=BACKEND_TIMEOUT)
+            data = parse_json(response)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            with _levels_cache_lock:
+                if data:
+                    _levels_cache[key] = data
+                else:
+                    _levels_empty[key] = True
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _prefetch_level(self, endpoint: str, params: dict) -> None:
+        """Warm the /levels cache for a list the user is likely to ask for next.
+        
+        Skipped when the list is already cached, recently came back empty, or the
+        prefetch backlog is full. Speculative requests count against their own
+        circuit breaker, so their failures never open the circuit for user lookups.
+        """
+        key = _levels_key(self.backend_url, endpoint, params)
+        with _levels_cache_lock:
+            if key in _levels_cache or key in _levels_empty:
+                return
+        if not _levels_prefetch_slots.acquire(blocking=False):
+            return
+
+        def run() -> None:
+            try:
+                self._fetch_level(endpoint, params, breaker="levels-prefetch")
+            except Exception as e:
+                logger.debug("Prefetch of %s %s failed: %s", endpoint, params, e)
+            finally:
+                _levels_prefetch_slots.release()
+
+        _levels_prefetch_pool.submit(run)
+
     @staticmethod
-    def _extract_numeric(data, field_names: list) -> Optional[float]:
+    def _extract_numeric(data, field_names: Tuple[str, ...]) -> Optional[float]:
         """Try to extract a numeric value from data using common field names."""
         if isinstance(data, (int, float)):
             return float(data)
         if isinstance(data, dict):
             for name in field_names:
-                if name in data:
+                value = data.get(name)
+                if value is not None:
                     try:
-                        return float(data[name])
+                        return float(value)
                     except (ValueError, TypeError):
                         continue
         return None
@@ -38,29 +159,22 @@ class SolvencyService:
         """Fetch and display districts."""
         lang = session.language
         try:
-            url = f"{self.backend_url}/levels/districts"
-            params = {"area": session.area}
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_level("districts", {"area": session.area})
             
             if not data:
                 return get_message("no_districts", lang)
             
             session.state = "SETUP_SELECT_DISTRICT"
             
-            # Create numbered mapping
-            session.district_map = {}
+            # Create numbered list
+            session.district_list = [district['code'] for district in data]
             header_key = "districts_header_urban" if session.area == "U" else "districts_header_rural"
-            result = get_message(header_key, lang)
-            
-            for i, district in enumerate(data, 1):
-                session.district_map[str(i)] = district['code']
-                result += f"{i}. {district['name']}\n"
+            numbered = "".join(f"{i}. {district['name']}\n" for i, district in enumerate(data, 1))
             
-            result += get_message("select_district", lang)
-            return result
+            # Fetch talukas for every district while the user reads the list
+            for district_code in session.district_list:
+                self._prefetch_level("talukas", {"area": session.area, "districtCode": district_code})
+            return get_message(header_key, lang) + numbered + get_message("select_district", lang)
             
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
@@ -71,28 +185,18 @@ class SolvencyService:
         """Fetch and display talukas."""
         lang = session.language
         try:
-            url = f"{self.backend_url}/levels/talukas"
             params = {"area": session.area, "districtCode": session.district_code}
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_level("talukas", params)
             
             if not data:
                 return get_message("no_talukas", lang)
             
             session.state = "SETUP_SELECT_TALUKA"
             
-            # Create numbered mapping
-            session.taluka_map = {}
-            result = get_message("talukas_header", lang)
-            
-            for i, taluka in enumerate(data, 1):
-                session.taluka_map[str(i)] = taluka['code']
-                result += f"{i}. {taluka['name']}\n"
-            
-            result += get_message("select_taluka", lang)
-            return result
+            # Create numbered list
+            session.taluka_list = [taluka['code'] for taluka in data]
+            numbered = "".join(f"{i}. {taluka['name']}\n" for i, taluka in enumerate(data, 1))
+            return get_message("talukas_header", lang) + numbered + get_message("select_taluka", lang)
             
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
@@ -103,34 +207,26 @@ class SolvencyService:
         """Fetch and display villages."""
         lang = session.language
         try:
-            url = f"{self.backend_url}/levels/villages"
             params = {
                 "area": session.area, 
                 "districtCode": session.district_code,
                 "talukaCode": session.taluka_code
             }
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_level("villages", params)
             
             if not data:
                 return get_message("no_villages", lang)
             
             session.state = "SETUP_SELECT_VILLAGE"
             
-            # Create numbered mapping - use gisCode if available, otherwise code
-            session.village_map = {}
-            result = get_message("villages_header", lang)
-            
-            for i, village in enumerate(data, 1):
-                # Try gisCode first, then villageGisCode, then code
-                village_code = village.get('gisCode') or village.get('villageGisCode') or village.get('code')
-                session.village_map[str(i)] = village_code
-                result += f"{i}. {village['name']}\n"
-            
-            result += get_message("select_village", lang)
-            return result
+            # Create numbered list - use gisCode if available, otherwise code
+            # Try gisCode first, then villageGisCode, then code
+            session.village_list = [
+                village.get('gisCode') or village.get('villageGisCode') or village.get('code')
+                for village in data
+            ]
+            numbered = "".join(f"{i}. {village['name']}\n" for i, village in enumerate(data, 1))
+            return get_message("villages_header", lang) + numbered + get_message("select_village", lang)
             
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
@@ -141,33 +237,29 @@ class SolvencyService:
         """Fetch available plots and ask user to enter their plot number."""
         lang = session.language
         try:
-            url = f"{self.backend_url}/levels/surveys"
             params = {
                 "area": session.area, 
                 "districtCode": session.district_code,
                 "talukaCode": session.taluka_code,
                 "villageCode": session.village_gis_code  # surveys uses villageCode
             }
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_level("surveys", params)
             
             # Debug: log surveys API response to check for coordinates
-            print(f"[DEBUG] Surveys API response sample: {data[:2] if data else 'Empty'}")
+            logger.debug("Surveys API response sample: %s", data[:2] if data else 'Empty')
             
             if not data:
                 return get_message("no_plots", lang)
             
-            # Store available plots for validation
-            session.available_plots = data
+            # Store available plot numbers for validation
+            session.available_plots_set = frozenset(
+                str(plot['plotNo']) if isinstance(plot, dict) and 'plotNo' in plot else str(plot)
+                for plot in data
+            )
             session.state = "SETUP_SELECT_PLOT"
             
             plot_count = len(data)
-            result = get_message("plots_header", lang)
-            result += get_message("plots_found", lang, count=plot_count)
-            
-            return result
+            return get_message("plots_header", lang) + get_message("plots_found", lang, count=plot_count)
             
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
@@ -192,62 +284,64 @@ class SolvencyService:
                 "plotNo": session.plot_no
             }
             
-            plot_response = requests.get(plot_url, params=plot_params, timeout=30)
-            plot_response.raise_for_status()
-            plot_data = plot_response.json()
+            plot_response = call_backend("levels", self.http.get, plot_url, params=plot_params, timeout=BACKEND_TIMEOUT)
+            plot_data = parse_json(plot_response)
             
             # Debug: log the plot API response
-            print(f"[DEBUG] Plot info API response: {plot_data}")
+            logger.debug("Plot info API response: %s", plot_data)
             
             # Save coordinates for reuse
             session.latitude = plot_data.get('latitudeApprox')
             session.longitude = plot_data.get('longitudeApprox')
             
             # Debug: log the extracted coordinates
-            print(f"[DEBUG] Extracted coordinates: lat={session.latitude}, lon={session.longitude}")
+            logger.debug("Extracted coordinates: lat=%s, lon=%s", session.latitude, session.longitude)
             
             # If coordinates are missing, we can't proceed with water balance calculations
             if session.latitude is None or session.longitude is None:
-                print("[ERROR] No coordinates returned from plot-info API - water balance calculations will fail")
+                logger.error("No coordinates returned from plot-info API - water balance calculations will fail")
             
             owners = plot_data.get('owners', [])
             session.plot_owners = owners
             
             # Format plot details
-            result = get_message("plot_info_header", lang)
-            result += get_message("plot_no_label", lang, plot_no=session.plot_no) + "\n"
+            parts = [
+                get_message("plot_info_header", lang),
+                get_message("plot_no_label", lang, plot_no=session.plot_no), "\n",
+            ]
             
             # Handle None coordinates safely
             lat_str = f"{session.latitude:.6f}" if session.latitude else "N/A"
             lon_str = f"{session.longitude:.6f}" if session.longitude else "N/A"
-            result += get_message("coordinates_label", lang, lat=lat_str, lon=lon_str) + "\n"
+            parts += [get_message("coordinates_label", lang, lat=lat_str, lon=lon_str), "\n"]
             
             # Show ALL owners as numbered list for selection
             if owners:
-                result += get_message("plot_owners_header", lang)
-                session.owner_map = {}
-                for i, owner in enumerate(owners, 1):
-                    owner_name = owner.get('ownerName', 'N/A')
-                    owner_area = owner.get('totalArea', 'N/A')
-                    print(f"[DEBUG] Owner {i}: name={owner_name}, totalArea from API={owner_area}")
-                    session.owner_map[str(i)] = {
-                        'name': owner_name,
-                        'area': float(owner_area) if owner_area != 'N/A' else 0
-                    }
-                    result += f"{i}. {owner_name} ({owner_area} ares)\n"
-                
-                result += get_message("select_owner_prompt", lang)
+                named = [(owner.get('ownerName', 'N/A'), owner.get('totalArea', 'N/A')) for owner in owners]
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, (owner_name, owner_area) in enumerate(named, 1):
+                        logger.debug("Owner %d: name=%s, totalArea from API=%s", i, owner_name, owner_area)
+                session.owner_list = [
+                    {'name': owner_name, 'area': float(owner_area) if owner_area != 'N/A' else 0}
+                    for owner_name, owner_area in named
+                ]
+                parts += [
+                    get_message("plot_owners_header", lang),
+                    "".join(f"{i}. {owner_name} ({owner_area} ares)\n" for i, (owner_name, owner_area) in enumerate(named, 1)),
+                    get_message("select_owner_prompt", lang),
+                ]
                 session.state = "SETUP_SELECT_OWNER"
+                self._prefetch_balances(session.latitude, session.longitude,
+                                        {owner['area'] for owner in session.owner_list})
             else:
                 # No owners found - use default and complete setup
                 session.farm_area_ares = 0
                 session.owner_name = "Unknown"
                 session.location_setup_complete = True
                 session.state = "MAIN_MENU"
-                result += get_message("location_saved", lang) + "\n\n"
-                result += get_message("main_menu", lang)
+                parts += [get_message("location_saved", lang), "\n\n", get_message("main_menu", lang)]
             
-            return result
+            return "".join(parts)
             
         except requests.exceptions.ConnectionError:
             raise ConnectionError(get_message("connection_error", lang))
@@ -256,10 +350,47 @@ class SolvencyService:
     
     # ── groundwater balance (silent calculation) ─────────────────────────
 
+    def _fetch_water_balance(self, latitude: float, longitude: float, farm_area_ares: Optional[float],
+                             breaker: str = "balance") -> Any:
+        """POST /balance/gw-balance and return the parsed response.
+        
+        ``breaker`` names the circuit breaker group the request counts against.
+        """
+        balance_url = f"{self.backend_url}/balance/gw-balance"
+        balance_payload = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "farm_area_ares": farm_area_ares
+        }
+        
+        balance_response = call_backend(
+            breaker, self.http.post, balance_url, 
+            data=orjson.dumps(balance_payload), 
+            timeout=BACKEND_TIMEOUT
+        )
+        return parse_json(balance_response)
+
+    def _prefetch_balances(self, latitude: Optional[float], longitude: Optional[float], areas: set) -> None:
+        """Start gw-balance requests for each candidate farm area in the background.
+        
+        Hides the balance round trip behind the user's owner selection. Speculative
+        requests count against their own circuit breaker, so their failures never
+        open the circuit for users.
+        """
+        if latitude is None or longitude is None or len(areas) > _MAX_BALANCE_PREFETCH:
+            return
+        for area in areas:
+            key = (self.backend_url, latitude, longitude, area)
+            with _balance_prefetch_lock:
+                if key not in _balance_prefetch:
+                    _balance_prefetch[key] = _prefetch_pool.submit(
+                        self._fetch_water_balance, latitude, longitude, area, breaker="balance-prefetch")
+
     def calculate_water_balance(self, session: ConversationState) -> None:
         """Fetch groundwater balance and save to session SILENTLY.
         
         Does not return any message - just stores the value for later comparison.
+        Uses the request prefetched by ``get_plot_info`` when there is one.
         Raises exception on error.
         """
         try:
@@ -267,36 +398,27 @@ class SolvencyService:
             if session.latitude is None or session.longitude is None:
                 raise ValueError(f"Missing coordinates: lat={session.latitude}, lon={session.longitude}")
             
-            balance_url = f"{self.backend_url}/balance/gw-balance"
-            balance_payload = {
-                "latitude": session.latitude,
-                "longitude": session.longitude,
-                "farm_area_ares": session.farm_area_ares
-            }
-            
-            balance_response = requests.post(
-                balance_url, 
-                json=balance_payload, 
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-            balance_response.raise_for_status()
-            balance_data = balance_response.json()
+            location = (session.latitude, session.longitude, session.farm_area_ares)
+            with _balance_prefetch_lock:
+                prefetched = _balance_prefetch.pop((self.backend_url, *location), None)
+            if prefetched is not None:
+                try:
+                    balance_data = prefetched.result()
+                except BackendUnavailable:
+                    # Only the speculative circuit is open; ask again as a user request
+                    prefetched = None
+            if prefetched is None:
+                balance_data = self._fetch_water_balance(*location)
             
             # Debug: log the actual API response
-            print(f"[DEBUG] Water balance API response: {balance_data}")
+            logger.debug("Water balance API response: %s", balance_data)
             
             # Save raw data and extract numeric balance
             session.water_balance_data = balance_data if isinstance(balance_data, dict) else {"balance": balance_data}
-            session.water_balance_value = self._extract_numeric(
-                balance_data,
-                ['groundwater_available_litres', 'balance', 'gw_balance', 'available_water', 'groundwater_balance',
-                 'total_balance', 'water_balance', 'net_balance',
-                 'water_required_litres', 'available_litres', 'total_water']
-            )
+            session.water_balance_value = self._extract_numeric(balance_data, _BALANCE_FIELDS)
             
             # Debug: log what value was extracted
-            print(f"[DEBUG] Extracted water balance value: {session.water_balance_value}")
+            logger.debug("Extracted water balance value: %s", session.water_balance_value)
             
         except requests.exceptions.ConnectionError:
             raise ConnectionError("Unable to connect to balance API.")
@@ -313,7 +435,14 @@ class SolvencyService:
         lang = session.language
         try:
             # Debug: log the farm area being used
-            print(f"[DEBUG] get_water_requirement called with farm_area_ares={session.farm_area_ares}")
+            logger.debug("get_water_requirement called with farm_area_ares=%s", session.farm_area_ares)
+            
+            # Speculatively request top crops alongside the requirement, so the
+            # "not enough water" reply doesn't pay a second round trip
+            # Speculative: counted against its own breaker so a broken top-crops
+            # endpoint can't open the circuit for /crop/water-requirement
+            top_crops_future = _prefetch_pool.submit(
+                self._fetch_top_crops, session.latitude, session.longitude, breaker="crop-prefetch")
             
             url = f"{self.backend_url}/crop/water-requirement"
             payload = {
@@ -323,13 +452,11 @@ class SolvencyService:
                 "farm_area": session.farm_area_ares
             }
             
-            response = requests.post(
-                url, json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30
+            response = call_backend(
+                "crop", self.http.post, url, data=orjson.dumps(payload),
+                timeout=BACKEND_TIMEOUT
             )
-            response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             
             # Parse response fields
             crop_used = data.get('crop_used') or session.crop or 'Unknown'
@@ -345,41 +472,45 @@ class SolvencyService:
             water_bal = session.water_balance_value
             
             # Debug: log the saved water balance and required water
-            print(f"[DEBUG] Saved water balance: {water_bal}")
-            print(f"[DEBUG] Water required for {crop_used}: {water_required}")
-            
-            result = get_message("water_req_header", lang, crop=crop_used.title())
-            result += get_message("station_label", lang, station=station.title()) + "\n"
-            result += get_message("season_label", lang, season=season.title()) + "\n\n"
-            result += get_message("crop_et_label", lang, value=crop_et_mm or 'N/A') + "\n"
-            result += get_message("seasonal_rain_label", lang, value=seasonal_rain_mm or 'N/A') + "\n"
-            result += get_message("effective_rain_label", lang, value=effective_rain_mm or 'N/A') + "\n"
-            result += get_message("net_irrigation_label", lang, value=net_irrigation_mm or 'N/A') + "\n"
-            result += get_message("total_water_label", lang, value=f"{water_required:,.0f}" if water_required is not None else 'N/A') + "\n"
-            result += f"💧 Available Groundwater: {f'{water_bal:,.0f}' if water_bal is not None else 'N/A'} litres\n"
-            result += get_message("estimated_profit_label", lang, value=f"{total_revenue:,.2f}" if total_revenue is not None else 'N/A') + "\n\n"
+            logger.debug("Saved water balance: %s", water_bal)
+            logger.debug("Water required for %s: %s", crop_used, water_required)
+            
+            parts = [
+                get_message("water_req_header", lang, crop=crop_used.title()),
+                get_message("station_label", lang, station=station.title()), "\n",
+                get_message("season_label", lang, season=season.title()), "\n\n",
+                get_message("crop_et_label", lang, value=crop_et_mm or 'N/A'), "\n",
+                get_message("seasonal_rain_label", lang, value=seasonal_rain_mm or 'N/A'), "\n",
+                get_message("effective_rain_label", lang, value=effective_rain_mm or 'N/A'), "\n",
+                get_message("net_irrigation_label", lang, value=net_irrigation_mm or 'N/A'), "\n",
+                get_message("total_water_label", lang, value=f"{water_required:,.0f}" if water_required is not None else 'N/A'), "\n",
+                f"💧 Available Groundwater: {f'{water_bal:,.0f}' if water_bal is not None else 'N/A'} litres\n",
+                get_message("estimated_profit_label", lang, value=f"{total_revenue:,.2f}" if total_revenue is not None else 'N/A'), "\n\n",
+            ]
             
             # Compare with groundwater balance
             if water_required is not None and water_bal is not None:
                 if water_required <= water_bal:
-                    result += get_message("solvency_success", lang,
-                                          balance=f"{water_bal:,.0f}",
-                                          required=f"{water_required:,.0f}",
-                                          crop=crop_used.title())
-                    result += get_message("menu_prompt", lang)
-                    return result
+                    parts.append(get_message("solvency_success", lang,
+                                             balance=f"{water_bal:,.0f}",
+                                             required=f"{water_required:,.0f}",
+                                             crop=crop_used.title()))
+                    parts.append(get_message("menu_prompt", lang))
+                    top_crops_future.cancel()
+                    return "".join(parts)
                 else:
-                    result += get_message("solvency_fail", lang,
-                                          balance=f"{water_bal:,.0f}",
-                                          required=f"{water_required:,.0f}",
-                                          crop=crop_used.title())
-                    result += "\n\n"
-                    # Fetch and append top crop recommendations
-                    top_crops_result = self.get_top_crops(session)
-                    return f"{result}{top_crops_result}"
+                    parts.append(get_message("solvency_fail", lang,
+                                             balance=f"{water_bal:,.0f}",
+                                             required=f"{water_required:,.0f}",
+                                             crop=crop_used.title()))
+                    parts.append("\n\n")
+                    # Append top crop recommendations (already requested in parallel)
+                    parts.append(self.get_top_crops(session, prefetched=top_crops_future))
+                    return "".join(parts)
             else:
-                result += get_message("menu_prompt", lang)
-                return result
+                parts.append(get_message("menu_prompt", lang))
+                top_crops_future.cancel()
+                return "".join(parts)
             
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
@@ -388,42 +519,79 @@ class SolvencyService:
     
     # ── top crop recommendations ─────────────────────────────────────────
 
-    def get_top_crops(self, session: ConversationState) -> str:
-        """Fetch top crop recommendations for the user's location."""
+    def _fetch_top_crops(self, latitude: Optional[float], longitude: Optional[float],
+                         breaker: str = "crop") -> dict:
+        """GET /crop/top-crops for a location and return the parsed response.
+        
+        Coordinates are rounded to 3 decimals, so neighbouring plots share one
+        cached response. The response is language-neutral; formatting happens in
+        ``get_top_crops``. ``breaker`` names the circuit breaker group the request
+        counts against.
+        """
+        if latitude is not None and longitude is not None:
+            latitude, longitude = round(latitude, 3), round(longitude, 3)
+        key = (self.backend_url, latitude, longitude)
+        with _top_crops_cache_lock:
+            cached = _top_crops_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        url = f"{self.backend_url}/crop/top-crops"
+        params = {
+            "latitude": latitude,
+            "longitude": longitude
+        }
+        
+        response = call_backend(breaker, self.http.get, url, params=params, timeout=BACKEND_TIMEOUT)
+        data = parse_json(response)
+        if data:
+            with _top_crops_cache_lock:
+                _top_crops_cache[key] = data
+        return data
+
+    def get_top_crops(self, session: ConversationState, prefetched: Optional[Future] = None) -> str:
+        """Fetch top crop recommendations for the user's location.
+        
+        ``prefetched`` is an already-submitted ``_fetch_top_crops`` call to use
+        instead of issuing a new request.
+        """
         lang = session.language
         try:
-            url = f"{self.backend_url}/crop/top-crops"
-            params = {
-                "latitude": session.latitude,
-                "longitude": session.longitude
-            }
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            if prefetched is not None:
+                try:
+                    data = prefetched.result()
+                except BackendUnavailable:
+                    # Only the speculative circuit is open; ask again as a user request
+                    prefetched = None
+            if prefetched is None:
+                data = self._fetch_top_crops(session.latitude, session.longitude)
             
             season = data.get('season') or 'N/A'
             station = data.get('station') or 'N/A'
             crops = data.get('top_3_crops', [])
             
-            result = get_message("recommendations_header", lang)
-            result += get_message("station_label", lang, station=station.title()) + "\n"
-            result += get_message("season_label", lang, season=season.title()) + "\n\n"
+            parts = [
+                get_message("recommendations_header", lang),
+                get_message("station_label", lang, station=station.title()), "\n",
+                get_message("season_label", lang, season=season.title()), "\n\n",
+            ]
             
             if crops:
+                score_template = get_template('profit_score_label', lang)
                 for i, crop in enumerate(crops, 1):
-                    crop_name = crop.get('crop') or 'Unknown'
+                    crop_name = (crop.get('crop') or 'Unknown').title()
                     profit_metric = crop.get('profit_metric')
-                    line = f"{i}. {crop_name.title()}"
                     if profit_metric is not None:
-                        line += f"  {get_message('profit_score_label', lang, score=f'{profit_metric:.4f}')}"
-                    result += line + "\n"
+                        score = score_template.format(score=f'{profit_metric:.4f}')
+                        parts.append(f"{i}. {crop_name}  {score}\n")
+                    else:
+                        parts.append(f"{i}. {crop_name}\n")
             else:
-                result += "No crop recommendations available.\n"
+                parts.append("No crop recommendations available.\n")
             
-            result += get_message("recommendations_tip", lang)
-            result += get_message("menu_prompt", lang)
-            return result
+            parts.append(get_message("recommendations_tip", lang))
+            parts.append(get_message("menu_prompt", lang))
+            return "".join(parts)
         
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
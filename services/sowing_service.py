@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import requests
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from translations import get_message
+from .http_client import BACKEND_TIMEOUT, call_backend, http_session, parse_json
 
 if TYPE_CHECKING:
     from models.conversation_state import ConversationState
@@ -13,8 +14,9 @@ if TYPE_CHECKING:
 class SowingService:
     """Handles all sowing advisory API operations."""
     
-    def __init__(self, backend_url: str):
+    def __init__(self, backend_url: str, http: Optional[requests.Session] = None):
         self.backend_url = backend_url
+        self.http = http or http_session
     
     def get_sowing_advice(self, session: ConversationState) -> str:
         """Fetch and display sowing advice for the given crop and location."""
@@ -28,48 +30,53 @@ class SowingService:
                 "crop": session.crop
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = call_backend("sowing", self.http.get, url, params=params, timeout=BACKEND_TIMEOUT)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check if it's a simple advice response
-                if 'advice' in data:
-                    result = f"🌱 Sowing Advisory:\n\n{data.get('advice', 'No advice available')}"
-                    result += get_message("menu_prompt", lang)
-                    return result
-                
-                # Otherwise, it's a detailed response with best_day
-                best_day = data.get("best_day", {})
-                top_3 = data.get("top_3_days", [])
-                crop_name = (data.get('crop') or session.crop or 'Unknown').title()
-                
-                result = get_message("sowing_result_header", lang, crop=crop_name)
-                result += get_message("best_sowing_date", lang, date=best_day.get('date', 'N/A')) + "\n"
-                result += get_message("score_label", lang, score=best_day.get('score', 'N/A')) + "\n\n"
-                result += get_message("soil_temp_label", lang, temp=best_day.get('soil_temp', 'N/A')) + "\n"
-                result += get_message("soil_moisture_label", lang, moisture=best_day.get('soil_moisture', 'N/A')) + "\n"
-                result += get_message("rain_prob_label", lang, prob=best_day.get('rain_prob', 'N/A')) + "\n"
-                result += get_message("expected_rain_label", lang, rain=best_day.get('rain_mm', 'N/A')) + "\n\n"
-                
-                if top_3:
-                    result += get_message("top_3_options", lang) + "\n"
-                    for i, day in enumerate(top_3, 1):
-                        result += f"{i}. {day.get('date', 'N/A')} (Score: {day.get('score', 'N/A')})\n"
-                    result += get_message("higher_score_tip", lang)
-                
-                result += get_message("menu_prompt", lang)
-                return result
-                
-            elif response.status_code == 400:
-                error_data = response.json()
-                if "Crop not found" in error_data.get("error", ""):
-                    return get_message("crop_not_found", lang, crop=session.crop) + get_message("menu_prompt", lang)
-                else:
-                    return get_message("error_generic", lang, error=error_data.get('error', 'Unknown error'))
-            else:
-                return get_message("error_generic", lang, error=f"API returned status code {response.status_code}")
+            data = parse_json(response)
+            
+            # Check if it's a simple advice response
+            if 'advice' in data:
+                return f"🌱 Sowing Advisory:\n\n{data.get('advice', 'No advice available')}" + get_message("menu_prompt", lang)
+            
+            # Otherwise, it's a detailed response with best_day
+            best_day = data.get("best_day", {})
+            top_3 = data.get("top_3_days", [])
+            crop_name = (data.get('crop') or session.crop or 'Unknown').title()
+            
+            parts = [
+                get_message("sowing_result_header", lang, crop=crop_name),
+                get_message("best_sowing_date", lang, date=best_day.get('date', 'N/A')), "\n",
+                get_message("score_label", lang, score=best_day.get('score', 'N/A')), "\n\n",
+                get_message("soil_temp_label", lang, temp=best_day.get('soil_temp', 'N/A')), "\n",
+                get_message("soil_moisture_label", lang, moisture=best_day.get('soil_moisture', 'N/A')), "\n",
+                get_message("rain_prob_label", lang, prob=best_day.get('rain_prob', 'N/A')), "\n",
+                get_message("expected_rain_label", lang, rain=best_day.get('rain_mm', 'N/A')), "\n\n",
+            ]
             
+            if top_3:
+                parts += [
+                    get_message("top_3_options", lang), "\n",
+                    "".join(f"{i}. {day.get('date', 'N/A')} (Score: {day.get('score', 'N/A')})\n" for i, day in enumerate(top_3, 1)),
+                    get_message("higher_score_tip", lang),
+                ]
+            
+            parts.append(get_message("menu_prompt", lang))
+            return "".join(parts)
+            
+        except requests.exceptions.HTTPError as e:
+            response = e.response
+            if response.status_code == 400:
+                # The body may not be a JSON object (e.g. an HTML error page from a proxy)
+                try:
+                    error_data = parse_json(response)
+                    crop_not_found = "Crop not found" in error_data.get("error", "")
+                    error = error_data.get('error', 'Unknown error')
+                except Exception as parse_error:
+                    return get_message("error_generic", lang, error=str(parse_error))
+                if crop_not_found:
+                    return get_message("crop_not_found", lang, crop=session.crop) + get_message("menu_prompt", lang)
+                return get_message("error_generic", lang, error=error)
+            return get_message("error_generic", lang, error=f"API returned status code {response.status_code}")
         except requests.exceptions.ConnectionError:
             return get_message("connection_error", lang)
         except requests.exceptions.Timeout:
@@ -0,0 +1,84 @@
+"""Storage backends for per-user conversation sessions."""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import asdict, fields
+from typing import Optional, Union
+
+import redis
+from cachetools import TTLCache
+
+from config import settings
+from models import ConversationState
+
+logger = logging.getLogger(__name__)
+
+
+class InMemorySessionStore:
+    """Keeps sessions in process memory (single worker / development).
+    
+    Bounded by a TTL cache so sessions of users who went quiet are evicted
+    instead of accumulating for the lifetime of the worker.
+    """
+
+    def __init__(self, maxsize: int = 100_000, ttl: int = 86_400) -> None:
+        self._sessions: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[ConversationState]:
+        with self._lock:
+            return self._sessions.get(user_id)
+
+    def put(self, user_id: str, state: ConversationState) -> None:
+        with self._lock:
+            self._sessions[user_id] = state
+
+
+class RedisSessionStore:
+    """Keeps sessions in Redis so any worker can serve any user.
+    
+    Redis errors are logged rather than raised: a failed read starts the user
+    on a fresh session and a failed write is dropped, so a Redis blip costs
+    conversation state instead of the reply.
+    """
+
+    def __init__(self, url: str, ttl: int = 1800, prefix: str = "sess:") -> None:
+        # Short socket timeouts so an unreachable Redis fails fast instead of hanging
+        self.client = redis.Redis.from_url(url, socket_timeout=1, socket_connect_timeout=1)
+        self.ttl = ttl
+        self.prefix = prefix
+        self._field_names = frozenset(f.name for f in fields(ConversationState))
+
+    def get(self, user_id: str) -> Optional[ConversationState]:
+        try:
+            raw = self.client.get(f"{self.prefix}{user_id}")
+        except redis.RedisError as exc:
+            logger.warning("Could not load session for %s: %s", user_id, exc)
+            return None
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            logger.warning("Discarding unreadable session for %s", user_id)
+            return None
+        # Ignore fields written by an older/newer version of ConversationState
+        return ConversationState(**{k: v for k, v in data.items() if k in self._field_names})
+
+    def put(self, user_id: str, state: ConversationState) -> None:
+        try:
+            self.client.setex(f"{self.prefix}{user_id}", self.ttl, json.dumps(asdict(state), default=list))
+        except redis.RedisError as exc:
+            logger.warning("Could not save session for %s: %s", user_id, exc)
+
+
+SessionStore = Union[InMemorySessionStore, RedisSessionStore]
+
+
+def make_session_store() -> SessionStore:
+    """Return a Redis store when REDIS_URL is configured, otherwise an in-memory one."""
+    if settings.redis_url:
+        return RedisSessionStore(settings.redis_url, ttl=settings.session_ttl)
+    return InMemorySessionStore()
@@ -0,0 +1,77 @@
+"""Tests for the shared backend HTTP helpers."""
+import threading
+import time
+
+import pytest
+import requests
+
+from services import http_client
+from services.http_client import BackendUnavailable, call_backend
+
+
+def _response(status: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = b"{}"
+    response.url = "http://backend/test"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def closed_breakers():
+    for breaker in http_client._breakers.values():
+        breaker.close()
+    yield
+    for breaker in http_client._breakers.values():
+        breaker.close()
+
+
+def test_requests_in_one_group_run_concurrently():
+    """The breaker must not serialise HTTP calls of the same endpoint group."""
+    both_inside = threading.Barrier(2, timeout=2)
+
+    def send(url, **kwargs):
+        both_inside.wait()  # only passes if the second call starts while the first is in flight
+        return _response(200)
+
+    errors = []
+
+    def worker():
+        try:
+            call_backend("levels", send, "http://backend/levels/districts")
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert time.monotonic() - started < 1
+
+
+def test_open_circuit_fails_fast_as_connection_error():
+    calls = []
+
+    def send(url, **kwargs):
+        calls.append(url)
+        raise requests.exceptions.ConnectTimeout("unreachable")
+
+    for _ in range(8):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            call_backend("sowing", send, "http://backend/sowing")
+
+    assert len(calls) == 5
+    with pytest.raises(BackendUnavailable):
+        call_backend("sowing", send, "http://backend/sowing")
+
+
+def test_client_errors_do_not_trip_the_breaker():
+    for _ in range(7):
+        with pytest.raises(requests.exceptions.HTTPError):
+            call_backend("crop", lambda url, **kwargs: _response(404), "http://backend/crop")
+
+    assert http_client._breakers["crop"].current_state == "closed"
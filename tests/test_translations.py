@@ -0,0 +1,47 @@
+"""The precompiled message renderers must match ``str.format`` exactly."""
+from string import Formatter
+
+import pytest
+
+from translations import MESSAGES, SUPPORTED_LANGUAGES, _RENDERERS, get_message, get_template
+
+def _placeholders(template):
+    return sorted({name for _, name, _, _ in Formatter().parse(template) if name})
+
+
+CASES = [(key, lang) for key in MESSAGES for lang in SUPPORTED_LANGUAGES]
+TEMPLATED_CASES = [(key, lang) for key, lang in CASES if _placeholders(get_template(key, lang))]
+
+
+def _reference(template, **kwargs):
+    """What get_message did before the renderers: str.format with the raw template on KeyError."""
+    try:
+        return template.format(**kwargs)
+    except KeyError:
+        return template
+
+
+def _sample_kwargs(names):
+    # Braces and quotes in values must come through verbatim, never be re-evaluated
+    values = ["Pune", 12.5, "{crop}", "it's \"quoted\"", 0, "नमस्ते"]
+    return {name: values[i % len(values)] for i, name in enumerate(names)}
+
+
+def test_renderers_are_compiled():
+    assert _RENDERERS
+
+
+@pytest.mark.parametrize("key,lang", CASES)
+def test_renders_like_str_format(key, lang):
+    template = get_template(key, lang)
+    kwargs = _sample_kwargs(_placeholders(template)) or {"unused": "x"}
+    assert get_message(key, lang, **kwargs) == _reference(template, **kwargs)
+
+
+@pytest.mark.parametrize("key,lang", TEMPLATED_CASES)
+def test_missing_argument_returns_raw_template(key, lang):
+    template = get_template(key, lang)
+    names = _placeholders(template)
+    kwargs = _sample_kwargs(names[1:])
+    kwargs["unused"] = "x"
+    assert get_message(key, lang, **kwargs) == _reference(template, **kwargs) == template
@@ -1,7 +1,10 @@
 """Multi-language message translations for JalNiti bot."""
 from __future__ import annotations
 
-from typing import Dict
+import keyword
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Language codes
 ENGLISH = "en"
@@ -447,11 +450,65 @@ MESSAGES: Dict[str, Dict[str, str]] = {
 }
 
 
+def _compile_template(template: str) -> Optional[Callable[..., str]]:
+    """Turn a ``str.format`` template into a function that renders it as an f-string.
+    
+    Only plain ``{name}`` placeholders are compiled; templates using conversions,
+    format specs, indexing or no placeholders at all return None and keep using
+    ``str.format``. Literal text is embedded via ``repr`` so it is never evaluated.
+    """
+    pieces: List[str] = []
+    names: List[str] = []
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+    for literal, name, spec, conversion in parsed:
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        if spec or conversion or not name.isidentifier() or keyword.iskeyword(name):
+            return None
+        pieces.append("{" + name + "}")
+        if name not in names:
+            names.append(name)
+    if not names:
+        return None
+    source = f"def _render({', '.join(names)}, **_unused):\n    return f{''.join(pieces)!r}\n"
+    namespace: Dict[str, Callable[..., str]] = {}
+    exec(source, namespace)
+    return namespace["_render"]
+
+
+# Precompiled renderers for every templated message, keyed by (key, lang)
+_RENDERERS: Dict[Tuple[str, str], Callable[..., str]] = {}
+for _key, _translations in MESSAGES.items():
+    for _lang, _template in _translations.items():
+        _renderer = _compile_template(_template)
+        if _renderer is not None:
+            _RENDERERS[(_key, _lang)] = _renderer
+
+
+@lru_cache(maxsize=512)
+def get_template(key: str, lang: str = ENGLISH) -> str:
+    """Return the raw (unformatted) template for (key, lang), falling back to English.
+    
+    Useful for hoisting a lookup out of a loop and calling ``.format`` per item.
+    """
+    msg_dict = MESSAGES.get(key, {})
+    return msg_dict.get(lang, msg_dict.get(ENGLISH, f"[Missing: {key}]"))
+
+
 def get_message(key: str, lang: str = ENGLISH, **kwargs) -> str:
     """Get a translated message with optional formatting."""
-    msg_dict = MESSAGES.get(key, {})
-    msg = msg_dict.get(lang, msg_dict.get(ENGLISH, f"[Missing: {key}]"))
+    msg = get_template(key, lang)
     if kwargs:
+        render = _RENDERERS.get((key, lang))
+        if render is not None:
+            try:
+                return render(**kwargs)
+            except TypeError:  # a placeholder argument is missing
+                return msg
         try:
             return msg.format(**kwargs)
         except KeyError:
@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import logging
-import time
 import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
 from flask import Blueprint, jsonify, request
 
 from config import settings
@@ -12,7 +16,16 @@ from whatsapp_client import client as whatsapp_client
 
 webhook_bp = Blueprint("webhook", __name__)
 logger = logging.getLogger(__name__)
-conversation_engine = default_engine()
+
+# Replies are produced on a background pool so Meta gets its 200 straight away.
+# Each user with work outstanding has a queue that is drained by one pool task at a
+# time, so one user's messages stay ordered while a slow reply only holds up that
+# user (sized to match the server's thread count by default).
+_reply_pool = ThreadPoolExecutor(max_workers=max(1, settings.reply_workers), thread_name_prefix="reply")
+_pending: Dict[str, Deque[str]] = {}
+_pending_lock = threading.Lock()
+# Read receipts are fire-and-forget so their round trip overlaps reply work
+_receipt_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="receipt")
 
 
 @webhook_bp.route("/webhook", methods=["GET"])
@@ -30,51 +43,90 @@ def verify_webhook():
     return "Forbidden", 403
 
 
+def _mark_as_read(message_id: str) -> None:
+    try:
+        whatsapp_client.mark_as_read(message_id)
+    except Exception as exc:  # pragma: no cover - skeleton diagnostic
+        logger.warning("Failed to mark %s as read: %s", message_id, exc)
+
+
+def _process_message(user_id: str, body: str) -> None:
+    """Produce and send the reply for one inbound message (runs off the request thread)."""
+    try:
+        # 1. Process the logic
+        # default_engine() builds the shared engine on first use, not at import
+        reply = default_engine().handle_incoming(user_id, body)
+
+        # 2. Send the response
+        whatsapp_client.send_text_message(user_id, reply)
+    except Exception as exc:  # pragma: no cover - skeleton diagnostic
+        logger.exception("Failed to reply to %s: %s", user_id, exc)
+
+
+def _drain(user_id: str) -> None:
+    """Answer a user's queued messages one after another until the queue is empty."""
+    while True:
+        with _pending_lock:
+            queue = _pending[user_id]
+            if not queue:
+                del _pending[user_id]
+                return
+            body = queue.popleft()
+        _process_message(user_id, body)
+
+
+def _extract_messages(data: dict) -> List[Tuple[str, Optional[str], str]]:
+    """Flatten a webhook payload into (user_id, message_id, body) tuples."""
+    items = []
+    for entry in data.get("entry", []):
+        for change in entry.get("changes", []):
+            value = change.get("value", {})
+            for message in value.get("messages", []):
+                user_id = message.get("from")
+                if not user_id:
+                    continue
+                body = message.get("text", {}).get("body", "")
+                items.append((user_id, message.get("id"), body))
+    return items
+
+
+def _enqueue(user_id: str, message_id: Optional[str], body: str) -> None:
+    """Queue a message behind its user's earlier ones so replies stay in order."""
+    # Mark as read (Blue ticks) right away, even if the user's queue is still busy
+    if message_id:
+        _receipt_pool.submit(_mark_as_read, message_id)
+    with _pending_lock:
+        queue = _pending.get(user_id)
+        start = queue is None
+        if start:
+            _pending[user_id] = deque((body,))
+        else:
+            queue.append(body)
+    if start:
+        _reply_pool.submit(_drain, user_id)
+
+
 @webhook_bp.route("/webhook", methods=["POST"])
 def handle_message():
-    """Receive WhatsApp message events and send a canned reply."""
+    """Receive WhatsApp message events and queue a reply for each one.
+    
+    The whole payload is parsed before anything is queued, so a malformed
+    event yields a 500 (and a retry from Meta) without double-answering the
+    messages that came before it. Messages from different users are then
+    answered in parallel.
+    """
     data = request.get_json(silent=True) or {}
     if data.get("object") != "whatsapp_business_account":
         return jsonify({"status": "ignored"}), 200
 
     try:
-        for entry in data.get("entry", []):
-            for change in entry.get("changes", []):
-                value = change.get("value", {})
-                for message in value.get("messages", []):
-                    user_id = message.get("from")
-                    message_id = message.get("id")
-                    body = message.get("text", {}).get("body", "")
-                    
-                    if not user_id:
-                        continue
-                        
-                    logger.info("Incoming message from %s: %s", user_id, body)
-                    
-                    # 1. Mark as read immediately (Blue ticks)
-                    if message_id:
-                        whatsapp_client.mark_as_read(message_id)
-                    
-                    # 2. Process the logic
-                    reply = conversation_engine.handle_incoming(user_id, body)
-                    
-                    # 3. Simulate natural typing delay (Reading + Typing time)
-                    # Average reading: 200 wpm (0.3s per word)
-                    # Average typing: 40 wpm (1.5s per word)
-                    input_words = len(body.split())
-                    output_words = len(reply.split())
-                    
-                    # Calculate delay: small base + reading time + 10% of typing time (since it's a bot)
-                    # We don't want it to be TOO slow, just "natural"
-                    delay = 0.5 + (input_words * 0.1) + (output_words * 0.05)
-                    delay = min(max(1.0, delay), 4.0)  # Clamp between 1s and 4s
-                    
-                    time.sleep(delay)
-                    
-                    # 4. Send the response
-                    whatsapp_client.send_text_message(user_id, reply)
+        items = _extract_messages(data)
     except Exception as exc:  # pragma: no cover - skeleton diagnostic
         logger.exception("Failed to process webhook: %s", exc)
         return jsonify({"status": "error"}), 500
 
+    for user_id, message_id, body in items:
+        logger.info("Incoming message from %s: %s", user_id, body)
+        _enqueue(user_id, message_id, body)
+
     return jsonify({"status": "ok"}), 200
@@ -2,13 +2,29 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Dict, Optional
-import requests
+import httpx
+import orjson
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Connect/read timeouts for Graph API calls; a long read wait on the send path
+# would only pile up more work behind a slow API
+SEND_TIMEOUT = httpx.Timeout(5.0, connect=3.05)
+
+# Retried with exponential backoff (0.5s, 1s, 2s), honouring Retry-After up to a cap
+# so one rate-limited reply can't stall its whole reply lane. Sends are not idempotent,
+# so they are only retried on statuses where the API did not accept the message;
+# read receipts are safe to repeat on any 5xx.
+_SEND_RETRY_STATUSES = frozenset({429, 503})
+_RECEIPT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+_MAX_RETRY_WAIT = 5.0
+
 
 class WhatsAppClient:
     def __init__(
@@ -16,12 +32,39 @@ class WhatsAppClient:
         access_token: Optional[str] = None,
         phone_number_id: Optional[str] = None,
         api_version: Optional[str] = None,
-        session: Optional[requests.Session] = None,
+        client: Optional[httpx.Client] = None,
     ) -> None:
         self.access_token = access_token or settings.access_token
         self.phone_number_id = phone_number_id or settings.phone_number_id
         self.api_version = api_version or settings.api_version
-        self.session = session or requests.Session()
+        if client is None:
+            # HTTP/2 multiplexes concurrent reply lanes over a few connections to the
+            # Graph API; connection failures are retried by the transport
+            client = httpx.Client(
+                timeout=SEND_TIMEOUT,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=_MAX_RETRIES,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                ),
+            )
+        self.client = client
+        self._url = f"https://graph.facebook.com/{self.api_version}/{self.phone_number_id}/messages"
+        self._headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+        }
+
+    def _post(self, payload: Dict[str, Any], retry_statuses: frozenset) -> httpx.Response:
+        """POST a payload to the messages endpoint, retrying the given statuses."""
+        content = orjson.dumps(payload)
+        for attempt in range(_MAX_RETRIES + 1):
+            response = self.client.post(self._url, headers=self._headers, content=content)
+            if response.status_code not in retry_statuses or attempt == _MAX_RETRIES:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            wait = float(retry_after) if retry_after.isdigit() else _BACKOFF_FACTOR * 2 ** attempt
+            time.sleep(min(wait, _MAX_RETRY_WAIT))
 
     def send_text_message(self, to: str, body: str) -> Dict[str, Any]:
         if not (self.access_token and self.phone_number_id):
@@ -31,11 +74,6 @@ class WhatsAppClient:
             print(f"\n[MOCK OUTGOING] To: {to}\nMessage: {body}\n")
             return {"status": "mock", "to": to, "body": body}
 
-        url = f"https://graph.facebook.com/{self.api_version}/{self.phone_number_id}/messages"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "messaging_product": "whatsapp",
             "to": to,
@@ -43,25 +81,20 @@ class WhatsAppClient:
             "text": {"body": body},
         }
 
-        response = self.session.post(url, headers=headers, json=payload, timeout=30)
+        response = self._post(payload, _SEND_RETRY_STATUSES)
         try:
             response.raise_for_status()
-        except requests.HTTPError as exc:  # pragma: no cover - simple skeleton logging
+        except httpx.HTTPStatusError as exc:  # pragma: no cover - simple skeleton logging
             logger.error("WhatsApp API error: %s", response.text)
             raise exc
         logger.info("WhatsApp message queued for %s", to)
-        return response.json()
+        return orjson.loads(response.content)
 
     def mark_as_read(self, message_id: str) -> Dict[str, Any]:
         """Mark a message as read to show blue ticks."""
         if not (self.access_token and self.phone_number_id):
             return {"status": "mock"}
 
-        url = f"https://graph.facebook.com/{self.api_version}/{self.phone_number_id}/messages"
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
         payload = {
             "messaging_product": "whatsapp",
             "status": "read",
@@ -69,11 +102,11 @@ class WhatsAppClient:
         }
 
         try:
-            response = self.session.post(url, headers=headers, json=payload, timeout=30)
+            response = self._post(payload, _RECEIPT_RETRY_STATUSES)
             response.raise_for_status()
             logger.info("Message marked as read: %s", message_id)
-            return response.json()
-        except requests.HTTPError:
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError:
             logger.error("Failed to mark message as read: %s", response.text)
             return {"error": response.text}
 